@@ -25,15 +25,50 @@ experimenters and automated Codex operators alike.
 
 from __future__ import annotations
 
+import collections
+import itertools
 import json
 import os
-import queue
+import select
+import selectors
 import subprocess
+import sys
 import threading
 import time
 import uuid
 from dataclasses import dataclass
-from typing import Dict, Generator, Iterable, List, Optional
+from typing import Dict, Generator, Iterable, List, Optional, Tuple
+
+try:  # pragma: no cover - optional accelerator, exercised at runtime
+    from orjson import loads as _orjson_loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    _orjson_loads = None
+
+
+def _json_loads(line: bytes) -> object:
+    """Decode one stdout line, replacing invalid UTF-8 as text decoding would.
+
+    orjson parses the bytes directly; it rejects invalid UTF-8 outright, so
+    such lines (and anything else it refuses) are retried through the stdlib
+    with ``errors="replace"``, which raises for lines that are not JSON.
+    """
+
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(line)
+        except json.JSONDecodeError:
+            pass
+    return json.loads(line.decode("utf-8", "replace"))
+
+
+def _pipe_max_size() -> int:
+    """Return the unprivileged pipe size limit, or the 64 KiB default."""
+
+    try:
+        with open("/proc/sys/fs/pipe-max-size", "rb") as handle:
+            return int(handle.read())
+    except (OSError, ValueError):
+        return 65536
 
 
 @dataclass
@@ -66,9 +101,11 @@ class CodexGodotProcessManager:
         Optional environment overrides that are merged with the inherited
         environment.
     heartbeat_interval:
-        Optional number of seconds between heartbeat checks.  When provided a
-        lightweight monitor thread will emit timeout diagnostics whenever no
-        stdout message is observed for longer than ``heartbeat_timeout``.
+        Optional number of seconds that enables the heartbeat watchdog.  When
+        provided the I/O thread will emit timeout diagnostics whenever no
+        stdout message is observed for longer than ``heartbeat_timeout``.  The
+        thread schedules each check for the moment the timeout would elapse
+        rather than polling at a fixed rate.
     heartbeat_timeout:
         Number of seconds to tolerate without receiving a message before a
         heartbeat diagnostic is published.  When omitted it defaults to
@@ -81,6 +118,13 @@ class CodexGodotProcessManager:
     #: Method invoked automatically to negotiate a banner for Codex sessions.
     _BANNER_METHOD = "codex.banner"
 
+    #: Maximum number of bytes pulled from a pipe per ``os.read`` call.
+    _READ_CHUNK_SIZE = 65536
+
+    #: Kernel buffer size requested for the stdout/stderr pipes on Linux so a
+    #: chatty Godot process can run further ahead of the reader before blocking.
+    _PIPE_BUFFER_SIZE = 1 << 20
+
     def __init__(
         self,
         *,
@@ -103,26 +147,38 @@ class CodexGodotProcessManager:
                 "Project root not provided. Set CODEX_PROJECT_ROOT or pass project_root."
             )
 
-        self.extra_args = list(extra_args or [])
+        self.extra_args: Tuple[str, ...] = tuple(extra_args or ())
         self.env_overrides = dict(env_overrides or {})
         self.heartbeat_interval = heartbeat_interval
         self.heartbeat_timeout = (
             heartbeat_timeout if heartbeat_timeout is not None else heartbeat_interval
         )
         self.banner_timeout = banner_timeout
+        self._command: Tuple[str, ...] = (
+            self.godot_binary,
+            "--headless",
+            "--path",
+            self.project_root,
+            *self.extra_args,
+        )
+        self._heartbeat_timeout_ns = (
+            int(self.heartbeat_timeout * 1e9) if self.heartbeat_timeout else 0
+        )
 
-        self._process: Optional[subprocess.Popen[str]] = None
-        self._stdout_thread: Optional[threading.Thread] = None
-        self._stderr_thread: Optional[threading.Thread] = None
-        self._heartbeat_thread: Optional[threading.Thread] = None
+        self._process: Optional[subprocess.Popen[bytes]] = None
+        self._io_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
-        self._stdout_queue: "queue.Queue[str | None]" = queue.Queue()
-        self._stderr_queue: "queue.Queue[dict | None]" = queue.Queue()
-        self._id_counter = 1
+        # ``deque.append``/``popleft`` are atomic in CPython, so the I/O thread
+        # hands lines over without a lock and only signals the paired event.
+        self._stdout_deque: "collections.deque[bytes | None]" = collections.deque()
+        self._stdout_ready = threading.Event()
+        self._stderr_deque: "collections.deque[dict | None]" = collections.deque()
+        self._stderr_ready = threading.Event()
+        self._id_gen = itertools.count(1)
         self._banner_request_id: Optional[int] = None
         self._banner: Optional[dict] = None
         self._session_id = str(uuid.uuid4())
-        self._last_activity = time.monotonic()
+        self._last_activity_ns = time.monotonic_ns()
 
     # ------------------------------------------------------------------
     # Context manager support
@@ -140,7 +196,7 @@ class CodexGodotProcessManager:
         return bool(self._process and self._process.poll() is None)
 
     def start(self) -> None:
-        """Start the Godot process and associated reader threads."""
+        """Start the Godot process and the associated I/O thread."""
 
         if self.is_running:
             return
@@ -148,42 +204,30 @@ class CodexGodotProcessManager:
         env = os.environ.copy()
         env.update(self.env_overrides)
 
-        command = [
-            self.godot_binary,
-            "--headless",
-            "--path",
-            self.project_root,
-        ] + self.extra_args
-
         self._process = subprocess.Popen(
-            command,
+            self._command,
             stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-            bufsize=1,
+            # Raw byte pipes: the I/O thread reads large chunks and decodes
+            # complete lines itself instead of relying on line buffering.
+            text=False,
+            bufsize=0,
             env=env,
         )
 
         assert self._process.stdout is not None  # for type-checkers
         assert self._process.stderr is not None
         assert self._process.stdin is not None
+        self._grow_pipe_buffers()
 
         self._stop_event.clear()
-        self._stdout_thread = threading.Thread(
-            target=self._reader_thread,
-            args=(self._process.stdout, self._stdout_queue, "stdout"),
+        self._io_thread = threading.Thread(
+            target=self._io_loop,
+            name="CodexGodotIO",
             daemon=True,
         )
-        self._stderr_thread = threading.Thread(
-            target=self._reader_thread,
-            args=(self._process.stderr, self._stderr_queue, "stderr"),
-            daemon=True,
-        )
-        self._stdout_thread.start()
-        self._stderr_thread.start()
+        self._io_thread.start()
 
         self._banner_request_id = self.send_command(
             self._BANNER_METHOD,
@@ -195,19 +239,17 @@ class CodexGodotProcessManager:
             id_override=0,
         )
 
-        if self.heartbeat_interval:
-            self._heartbeat_thread = threading.Thread(
-                target=self._heartbeat_monitor,
-                name="CodexGodotHeartbeat",
-                daemon=True,
-            )
-            self._heartbeat_thread.start()
-
     def stop(self) -> None:
-        """Terminate the Godot process and wait for reader threads to exit."""
+        """Terminate the Godot process and wait for the I/O thread to exit.
+
+        Once the process has exited the I/O thread keeps reading until both
+        pipes reach EOF, so everything Godot wrote before exiting is still
+        available through :meth:`drain_messages` and
+        :meth:`drain_stderr_diagnostics` after this returns.
+        """
 
-        self._stop_event.set()
         if not self._process:
+            self._stop_event.set()
             return
 
         if self._process.stdin and not self._process.stdin.closed:
@@ -217,37 +259,78 @@ class CodexGodotProcessManager:
             except Exception:
                 pass
 
-        if self.is_running:
-            try:
-                self._process.terminate()
-                self._process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self._process.kill()
-                self._process.wait(timeout=5)
-
-        if self._stdout_thread and self._stdout_thread.is_alive():
-            self._stdout_thread.join(timeout=1)
-        if self._stderr_thread and self._stderr_thread.is_alive():
-            self._stderr_thread.join(timeout=1)
-        if self._heartbeat_thread and self._heartbeat_thread.is_alive():
-            self._heartbeat_thread.join(timeout=1)
+        try:
+            if self.is_running:
+                try:
+                    self._process.terminate()
+                    self.wait_for_exit(5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self.wait_for_exit(5)
+        finally:
+            # Only interrupts the I/O loop while the process is still alive;
+            # after a clean exit the loop drains both pipes to EOF first.
+            self._stop_event.set()
+
+        if self._io_thread and self._io_thread.is_alive():
+            self._io_thread.join()
 
         self._process = None
 
+    def wait_for_exit(self, timeout: float) -> int:
+        """Wait up to ``timeout`` seconds for Godot to exit and return its exit code.
+
+        Linux exposes process exit through a pidfd and BSD/macOS through a
+        ``kqueue`` ``NOTE_EXIT`` event, both of which block in the kernel until
+        the process terminates instead of the sleep/poll loop behind
+        :meth:`subprocess.Popen.wait`.  An already reaped process returns its
+        exit code immediately.  Other platforms, or kernels that reject the
+        call, fall back to :meth:`subprocess.Popen.wait`.  Raises
+        :class:`subprocess.TimeoutExpired` when the process is still alive
+        after ``timeout`` seconds.
+        """
+
+        if self._process is None:
+            raise RuntimeError("Godot process is not running.")
+        # Once reaped the PID may already belong to another process.
+        if self._process.returncode is not None:
+            return self._process.returncode
+        pid = self._process.pid
+        try:
+            if hasattr(os, "pidfd_open"):
+                pidfd = os.pidfd_open(pid)
+                try:
+                    with selectors.DefaultSelector() as selector:
+                        selector.register(pidfd, selectors.EVENT_READ)
+                        selector.select(timeout)
+                finally:
+                    os.close(pidfd)
+            elif hasattr(select, "kqueue"):
+                kqueue = select.kqueue()
+                try:
+                    event = select.kevent(
+                        pid,
+                        filter=select.KQ_FILTER_PROC,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT,
+                        fflags=select.KQ_NOTE_EXIT,
+                    )
+                    kqueue.control([event], 1, timeout)
+                finally:
+                    kqueue.close()
+            else:
+                return self._process.wait(timeout=timeout)
+        except OSError:
+            return self._process.wait(timeout=timeout)
+        return self._process.wait(timeout=0)
+
     def describe_session(self) -> SessionDescription:
         """Return a snapshot of the currently running session."""
 
-        command: List[str] = [
-            self.godot_binary,
-            "--headless",
-            "--path",
-            self.project_root,
-        ] + self.extra_args
         pid = self._process.pid if self._process else None
         return SessionDescription(
             session_id=self._session_id,
             pid=pid,
-            command=command,
+            command=list(self._command),
             project_root=self.project_root,
             banner=self._banner,
             heartbeat_interval=self.heartbeat_interval,
@@ -264,25 +347,38 @@ class CodexGodotProcessManager:
     ) -> int:
         """Send a JSON-RPC style command to the running Godot process."""
 
-        if not self.is_running or not self._process or not self._process.stdin:
-            raise RuntimeError("Godot process is not running.")
+        self._ensure_stdin()
+        if id_override is None:
+            request_id = next(self._id_gen)
+        else:
+            request_id = id_override
+            # Keep generated ids clear of explicit overrides above the counter;
+            # the banner's ``0`` never needs this.
+            next_id = next(self._id_gen)
+            self._id_gen = itertools.count(max(next_id, request_id + 1))
+        self._write_messages([self._encode_command(request_id, method, params)])
+        return request_id
 
-        request_id = id_override if id_override is not None else self._id_counter
-        self._id_counter = max(self._id_counter, request_id + 1)
+    def send_commands(
+        self,
+        commands: Iterable[Tuple[str, Optional[dict]]],
+    ) -> List[int]:
+        """Send several ``(method, params)`` commands with a single pipe write.
 
-        payload = {
-            "id": request_id,
-            "method": method,
-            "params": params or {},
-        }
-        message = json.dumps(payload, separators=(",", ":")) + "\n"
-        try:
-            self._process.stdin.write(message)
-            self._process.stdin.flush()
-        except (BrokenPipeError, ValueError) as error:  # pragma: no cover - I/O failure
-            raise RuntimeError("Failed to send command to Godot process") from error
+        Pipelined requests are serialised up front and handed to the kernel in
+        one ``write`` call.  The assigned request ids are returned in order.
+        """
 
-        return request_id
+        self._ensure_stdin()
+        request_ids: List[int] = []
+        messages: List[bytes] = []
+        for method, params in commands:
+            request_id = next(self._id_gen)
+            request_ids.append(request_id)
+            messages.append(self._encode_command(request_id, method, params))
+        if messages:
+            self._write_messages(messages)
+        return request_ids
 
     def iter_messages(
         self,
@@ -291,7 +387,7 @@ class CodexGodotProcessManager:
     ) -> Generator[dict, None, None]:
         """Yield parsed JSON messages produced by the Godot process.
 
-        The iterator consumes responses from the stdout queue.  It silently
+        The iterator consumes responses buffered by the I/O thread.  It silently
         handles the banner response that is negotiated automatically during
         :meth:`start`.  Non-JSON lines are treated as diagnostics and will be
         surfaced via :meth:`iter_stderr_diagnostics` with structured metadata.
@@ -300,109 +396,333 @@ class CodexGodotProcessManager:
         if not self.is_running:
             raise RuntimeError("Godot process is not running.")
 
-        while True:
+        # Held locally so that, once the banner is consumed, every later
+        # message only pays a single ``is not None`` check.
+        banner_id = self._banner_request_id
+        for line in self._iter_stdout_lines(timeout):
             try:
-                line = self._stdout_queue.get(timeout=timeout)
-            except queue.Empty:
-                self._maybe_emit_heartbeat_timeout()
+                message = _json_loads(line)
+            except json.JSONDecodeError:
+                self.report_protocol_error(line)
                 continue
 
-            if line is None:
-                break
+            self._last_activity_ns = time.monotonic_ns()
 
-            stripped = line.strip()
-            if not stripped:
+            if banner_id is not None and message.get("id") == banner_id:
+                self._store_banner(message)
+                banner_id = None
                 continue
 
+            yield message
+
+    def iter_raw_messages(
+        self,
+        *,
+        timeout: Optional[float] = None,
+    ) -> Generator[bytes, None, None]:
+        """Yield undecoded stdout lines for callers that bring their own decoder.
+
+        Blank lines are skipped and the banner response is still consumed
+        internally, but every other line is yielded verbatim as ``bytes``.
+        Callers should hand lines they fail to decode to
+        :meth:`report_protocol_error` so they surface alongside the other
+        diagnostics.  Every yielded line counts as heartbeat activity.
+        """
+
+        if not self.is_running:
+            raise RuntimeError("Godot process is not running.")
+
+        while True:
+            batch = self.drain_messages(timeout=timeout)
+            if batch is None:
+                return
+            yield from batch
+
+    def drain_messages(
+        self,
+        *,
+        max_batch: int = 256,
+        timeout: Optional[float] = None,
+    ) -> Optional[List[bytes]]:
+        """Return up to ``max_batch`` buffered stdout lines in a single call.
+
+        Lines are handled exactly like :meth:`iter_raw_messages`.  The call only
+        blocks (for at most ``timeout`` seconds) when nothing is buffered, in
+        which case an empty list is returned if no line arrived in time.  Once
+        stdout has closed and every buffered line was drained ``None`` is
+        returned.
+        """
+
+        if self._process is None:
+            raise RuntimeError("Godot process is not running.")
+
+        pending = self._stdout_deque
+        if not pending:
+            if not self._stdout_ready.wait(timeout):
+                self._maybe_emit_heartbeat_timeout()
+            self._stdout_ready.clear()
+
+        batch: List[bytes] = []
+        banner_id = self._banner_request_id
+        while len(batch) < max_batch:
             try:
-                message = json.loads(stripped)
-            except json.JSONDecodeError:
-                self._stderr_queue.put(
-                    {
-                        "timestamp": time.time(),
-                        "stream": "stdout",
-                        "text": stripped,
-                        "level": "protocol",
-                    }
-                )
-                continue
+                line = pending.popleft()
+            except IndexError:
+                break
 
-            self._last_activity = time.monotonic()
+            if line is None:
+                # Leave the sentinel in place so every later call reports EOF.
+                pending.appendleft(None)
+                if not batch:
+                    return None
+                break
 
-            if self._banner_request_id is not None and message.get("id") == self._banner_request_id:
-                banner_payload = message.get("result")
-                if isinstance(banner_payload, dict):
-                    self._banner = banner_payload
-                else:
-                    self._banner = {"message": banner_payload}
-                self._banner_request_id = None
+            line = line.strip()
+            if not line:
                 continue
 
-            yield message
+            # Only lines carrying an ``id`` can be the banner response; the
+            # runners never answer it, so everything else skips the decode.
+            if banner_id is not None and b'"id"' in line:
+                try:
+                    message = _json_loads(line)
+                except json.JSONDecodeError:
+                    message = None
+                if isinstance(message, dict) and message.get("id") == banner_id:
+                    self._store_banner(message)
+                    banner_id = None
+                    continue
+
+            batch.append(line)
+
+        if batch:
+            self._last_activity_ns = time.monotonic_ns()
+        return batch
+
+    def report_protocol_error(self, line: bytes) -> None:
+        """Record a stdout line that is not valid protocol JSON as a diagnostic."""
+
+        self._push_stderr(
+            {
+                "timestamp": time.time(),
+                "stream": "stdout",
+                "text": line.decode("utf-8", "replace"),
+                "level": "protocol",
+            }
+        )
 
     def iter_stderr_diagnostics(self) -> Generator[dict, None, None]:
         """Yield structured diagnostics that originated from stderr or decoding errors."""
 
         while True:
             try:
-                payload = self._stderr_queue.get(timeout=0.1)
-            except queue.Empty:
-                if not self.is_running and self._stderr_queue.empty():
-                    return
-                if self._stop_event.is_set():
-                    return
+                payload = self._stderr_deque.popleft()
+            except IndexError:
+                if not self._stderr_ready.wait(0.1):
+                    if not self.is_running and not self._stderr_deque:
+                        return
+                    if self._stop_event.is_set():
+                        return
+                self._stderr_ready.clear()
                 continue
 
             if payload is None:
-                if not self.is_running and self._stderr_queue.empty():
+                if not self.is_running and not self._stderr_deque:
                     return
                 continue
             yield payload
 
+    def drain_stderr_diagnostics(self) -> List[dict]:
+        """Return the diagnostics buffered so far without waiting for more."""
+
+        pending = self._stderr_deque
+        drained: List[dict] = []
+        while True:
+            try:
+                payload = pending.popleft()
+            except IndexError:
+                return drained
+            if payload is not None:
+                drained.append(payload)
+
     # ------------------------------------------------------------------
     # Internal helpers
-    def _reader_thread(self, pipe, sink: "queue.Queue", source: str) -> None:
+    def _io_loop(self) -> None:
+        """Multiplex stdout, stderr, and heartbeat checks on a single thread.
+
+        Both pipes are registered with a :class:`selectors.DefaultSelector` and
+        drained in chunks of up to :attr:`_READ_CHUNK_SIZE` bytes.  Complete
+        lines are handed to the matching consumer while partial
+        lines stay buffered until their terminating newline arrives.  The
+        selector timeout doubles as the heartbeat deadline so no dedicated
+        monitor thread is required.
+        """
+
+        process = self._process
+        assert process is not None
+        stdout = process.stdout
+        stderr = process.stderr
+        assert stdout is not None and stderr is not None
+
+        selector = selectors.DefaultSelector()
+        selector.register(stdout.fileno(), selectors.EVENT_READ, "stdout")
+        selector.register(stderr.fileno(), selectors.EVENT_READ, "stderr")
+        buffers = {"stdout": bytearray(), "stderr": bytearray()}
         try:
-            for raw_line in iter(pipe.readline, ""):
-                if self._stop_event.is_set():
+            while selector.get_map():
+                # ``stop`` only gives up on output a process that refused to
+                # die may still write; an exited one is read to EOF.
+                if self._stop_event.is_set() and process.poll() is None:
                     break
-                if source == "stdout":
-                    sink.put(raw_line.rstrip("\n"))
-                else:
-                    sink.put(
-                        {
-                            "timestamp": time.time(),
-                            "stream": source,
-                            "text": raw_line.rstrip("\n"),
-                            "level": "error",
-                        }
-                    )
+                for key, _ in selector.select(timeout=self._next_heartbeat_delay()):
+                    source = key.data
+                    buffer = buffers[source]
+                    chunk = os.read(key.fd, self._READ_CHUNK_SIZE)
+                    if not chunk:
+                        selector.unregister(key.fd)
+                        if buffer:
+                            self._publish_line(source, bytes(buffer))
+                            buffer.clear()
+                        continue
+                    buffer.extend(chunk)
+                    if b"\n" not in chunk:
+                        continue
+                    *lines, remainder = buffer.split(b"\n")
+                    buffer[:] = remainder
+                    for line in lines:
+                        self._publish_line(source, line)
+                if self.heartbeat_interval:
+                    self._maybe_emit_heartbeat_timeout()
         finally:
-            sink.put(None)
-            pipe.close()
+            selector.close()
+            self._push_stdout(None)
+            self._push_stderr(None)
+            stdout.close()
+            stderr.close()
+
+    def _grow_pipe_buffers(self) -> None:
+        if not sys.platform.startswith("linux"):
+            return
+        import fcntl
+
+        assert self._process is not None
+        set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+        size = self._PIPE_BUFFER_SIZE
+        # Stdin is grown too so batched ``send_commands`` writes rarely block.
+        for pipe in (self._process.stdin, self._process.stdout, self._process.stderr):
+            if pipe is None:
+                continue
+            try:
+                fcntl.fcntl(pipe.fileno(), set_pipe_size, size)
+            except OSError:
+                # Unprivileged users are capped by /proc/sys/fs/pipe-max-size;
+                # retry once with that limit and keep the default otherwise.
+                size = min(size, _pipe_max_size())
+                try:
+                    fcntl.fcntl(pipe.fileno(), set_pipe_size, size)
+                except OSError:
+                    continue
+
+    def _iter_stdout_lines(self, timeout: Optional[float]) -> Generator[bytes, None, None]:
+        """Yield stripped, non-empty stdout lines until the stream closes."""
 
-    def _heartbeat_monitor(self) -> None:
-        assert self.heartbeat_interval is not None
-        while not self._stop_event.wait(self.heartbeat_interval):
-            if not self.is_running:
-                break
-            self._maybe_emit_heartbeat_timeout()
+        while True:
+            try:
+                line = self._stdout_deque.popleft()
+            except IndexError:
+                if not self._stdout_ready.wait(timeout):
+                    self._maybe_emit_heartbeat_timeout()
+                self._stdout_ready.clear()
+                continue
+
+            if line is None:
+                return
+
+            stripped = line.strip()
+            if stripped:
+                yield stripped
+
+    def _store_banner(self, message: dict) -> None:
+        banner_payload = message.get("result")
+        if isinstance(banner_payload, dict):
+            self._banner = banner_payload
+        else:
+            self._banner = {"message": banner_payload}
+        self._banner_request_id = None
+
+    def _ensure_stdin(self) -> None:
+        if not self.is_running or not self._process or not self._process.stdin:
+            raise RuntimeError("Godot process is not running.")
+
+    @staticmethod
+    def _encode_command(request_id: int, method: str, params: Optional[dict]) -> bytes:
+        payload = {
+            "id": request_id,
+            "method": method,
+            "params": params or {},
+        }
+        return (json.dumps(payload, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def _write_messages(self, messages: List[bytes]) -> None:
+        assert self._process is not None and self._process.stdin is not None
+        # stdin is unbuffered, so loop until the raw pipe accepted every byte.
+        view = memoryview(b"".join(messages))
+        try:
+            while view:
+                written = self._process.stdin.write(view)
+                view = view[written:]
+        except (BrokenPipeError, ValueError) as error:  # pragma: no cover - I/O failure
+            raise RuntimeError("Failed to send command to Godot process") from error
+
+    def _push_stdout(self, line: Optional[bytes]) -> None:
+        self._stdout_deque.append(line)
+        self._stdout_ready.set()
+
+    def _push_stderr(self, payload: Optional[dict]) -> None:
+        self._stderr_deque.append(payload)
+        self._stderr_ready.set()
+
+    def _publish_line(self, source: str, raw_line: bytes) -> None:
+        if source == "stdout":
+            # Stdout stays as bytes: consumers strip and decode it themselves,
+            # and orjson parses UTF-8 bytes without an intermediate ``str``.
+            self._push_stdout(raw_line)
+            return
+        self._push_stderr(
+            {
+                "timestamp": time.time(),
+                "stream": source,
+                "text": raw_line.rstrip(b"\r").decode("utf-8", "replace"),
+                "level": "error",
+            }
+        )
+
+    def _next_heartbeat_delay(self) -> Optional[float]:
+        """Return the seconds until a heartbeat timeout could next fire."""
+
+        if not self.heartbeat_interval or not self._heartbeat_timeout_ns:
+            return None
+        elapsed_ns = time.monotonic_ns() - self._last_activity_ns
+        return max(self._heartbeat_timeout_ns - elapsed_ns, 0) / 1e9
 
     def _maybe_emit_heartbeat_timeout(self) -> None:
-        if not self.heartbeat_timeout:
+        if not self._heartbeat_timeout_ns:
             return
-        elapsed = time.monotonic() - self._last_activity
-        if elapsed < self.heartbeat_timeout:
+        # Monotonic integer nanoseconds keep the check allocation free and
+        # immune to wall-clock adjustments; only the emitted timestamp is
+        # wall-clock time.
+        elapsed_ns = time.monotonic_ns() - self._last_activity_ns
+        if elapsed_ns < self._heartbeat_timeout_ns:
             return
         diagnostic = {
             "timestamp": time.time(),
             "stream": "heartbeat",
-            "text": f"No stdout messages for {elapsed:.2f}s",
+            "text": f"No stdout messages for {elapsed_ns / 1e9:.2f}s",
             "level": "warning",
             "session": self._session_id,
         }
-        self._stderr_queue.put(diagnostic)
-        self._last_activity = time.monotonic()
+        self._push_stderr(diagnostic)
+        self._last_activity_ns = time.monotonic_ns()
 
 
 __all__ = ["CodexGodotProcessManager", "SessionDescription"]
@@ -26,15 +26,23 @@ or ``--manifest-args -- <args>`` to forward options to the manifest runner.
 from __future__ import annotations
 
 import argparse
-import contextlib
+import codecs
 import io
 import json
+import os
+import re
+import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Optional, Sequence
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
 
-from gdscript_parse_helper import collect_issues, iter_gd_files, read_context
+from gdscript_parse_helper import collect_issues_from_files, iter_gd_files, slice_context
+
+try:  # pragma: no cover - optional accelerator, exercised at runtime
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Allow the helper to be executed directly with ``python tools/codex_preflight.py``.
@@ -44,13 +52,44 @@ if __package__ is None:  # pragma: no cover - import side effect
 
 from tools import codex_run_manifest_tests as manifest_runner
 
+_DECODER = json.JSONDecoder()
+_SUMMARY_MARKER = manifest_runner.MANIFEST_SUMMARY_MARKER.encode("utf-8")
+_STDERR_CHUNK_SIZE = 65536
+_WHITESPACE = re.compile(r"[\r\n \t]+")
+
+
+@dataclass
+class EnrichedIssue:
+    """A parse issue with its context snippet, ready for reporting."""
+
+    # Declared by hand rather than ``dataclass(slots=True)``, which needs
+    # Python 3.10; the fields have no defaults, so the two do not clash.
+    __slots__ = ("path", "message", "line", "column", "context")
+
+    path: str
+    message: str
+    line: Optional[int]
+    column: Optional[int]
+    context: List[str]
+
+    def to_dict(self) -> dict:
+        """Return a JSON-serialisable representation of the issue."""
+
+        return {
+            "path": self.path,
+            "message": self.message,
+            "line": self.line,
+            "column": self.column,
+            "context": self.context,
+        }
+
 
 @dataclass
 class ParseResult:
     """Container describing the outcome of the parse stage."""
 
     scripts_scanned: int
-    issues: List[dict]
+    issues: List[EnrichedIssue]
 
     @property
     def failure_count(self) -> int:
@@ -128,17 +167,23 @@ def _normalise_paths(paths: Iterable[Path]) -> List[Path]:
 
 def _run_parse_stage(paths: List[Path], context_radius: int) -> ParseResult:
     scripts = list(iter_gd_files(paths))
-    issues = collect_issues(paths)
-    enriched = []
+    issues = collect_issues_from_files(scripts)
+    # Files with several issues are read and split once, not once per issue.
+    context_cache: Dict[Path, List[str]] = {}
+    enriched: List[EnrichedIssue] = []
     for issue in issues:
+        lines = context_cache.get(issue.path)
+        if lines is None:
+            lines = issue.path.read_text(encoding="utf-8").splitlines()
+            context_cache[issue.path] = lines
         enriched.append(
-            {
-                "path": str(issue.path),
-                "message": issue.message,
-                "line": issue.line,
-                "column": issue.column,
-                "context": read_context(issue.path, issue.line, context_radius),
-            }
+            EnrichedIssue(
+                path=str(issue.path),
+                message=issue.message,
+                line=issue.line,
+                column=issue.column,
+                context=slice_context(lines, issue.line, context_radius),
+            )
         )
     return ParseResult(scripts_scanned=len(scripts), issues=enriched)
 
@@ -146,17 +191,17 @@ def _run_parse_stage(paths: List[Path], context_radius: int) -> ParseResult:
 def _decode_json_stream(stream: str) -> List[dict]:
     """Extract JSON objects from ``stream`` using a tolerant decoder."""
 
-    decoder = json.JSONDecoder()
     idx = 0
     payloads: List[dict] = []
     length = len(stream)
     while idx < length:
-        while idx < length and stream[idx] in "\r\n \t":
-            idx += 1
+        match = _WHITESPACE.match(stream, idx)
+        if match:
+            idx = match.end()
         if idx >= length:
             break
         try:
-            payload, offset = decoder.raw_decode(stream, idx)
+            payload, offset = _DECODER.raw_decode(stream, idx)
         except json.JSONDecodeError:
             break
         payloads.append(payload)
@@ -165,18 +210,98 @@ def _decode_json_stream(stream: str) -> List[dict]:
 
 
 def _run_manifest(manifest_args: Sequence[str]) -> ManifestResult:
-    stderr_buffer = io.StringIO()
-    with contextlib.redirect_stderr(stderr_buffer):
-        exit_code = manifest_runner.main(manifest_args)
+    """Run the manifest suite in a child interpreter and stream its stderr.
+
+    The child's stderr pipe is drained in chunks that are forwarded untouched
+    to our own stderr as soon as they arrive.  The payload is read from the
+    runner's single-line ``MANIFEST_SUMMARY_MARKER`` record.  When that record
+    is missing (for example because the runner aborted early) the text from
+    the most recent top level JSON object onwards is decoded instead – the
+    runner prints its payloads with ``indent=2`` so nested lines never start
+    at column zero – which keeps memory bounded by the final payload rather
+    than the whole log.
+    """
+
+    command = [sys.executable, manifest_runner.__file__, *manifest_args]
+    process = subprocess.Popen(command, stderr=subprocess.PIPE)
+    assert process.stderr is not None  # for type-checkers
+
+    forward = _stderr_forwarder()
+    payload: Optional[dict] = None
+    tail = bytearray()
+
+    def consume(line: bytes) -> None:
+        nonlocal payload
+        if line.startswith(_SUMMARY_MARKER):
+            try:
+                payload = json.loads(line[len(_SUMMARY_MARKER):])
+            except json.JSONDecodeError:
+                payload = None
+            return
+        if line.startswith(b"{"):
+            tail.clear()
+        tail.extend(line)
+        tail.extend(b"\n")
+
+    pending = bytearray()
+    with process.stderr:
+        fd = process.stderr.fileno()
+        while True:
+            chunk = os.read(fd, _STDERR_CHUNK_SIZE)
+            if not chunk:
+                break
+            forward(chunk)
+            pending.extend(chunk)
+            if b"\n" not in chunk:
+                continue
+            *lines, remainder = pending.split(b"\n")
+            pending[:] = remainder
+            for line in lines:
+                consume(line)
+        if pending:
+            consume(bytes(pending))
+    exit_code = process.wait()
+
+    if payload is None:
+        payloads = _decode_json_stream(tail.decode("utf-8", "replace"))
+        payload = payloads[-1] if payloads else None
+    return ManifestResult(exit_code=exit_code, payload=payload)
+
+
+def _stderr_forwarder() -> Callable[[bytes], None]:
+    """Return a callable that copies raw child stderr chunks to ``sys.stderr``.
+
+    Bytes go straight to the binary layer when one exists; replaced streams
+    without ``buffer`` (such as ``io.StringIO`` under test harnesses) receive
+    incrementally decoded text so multi-byte characters split across chunks
+    survive intact.
+    """
+
+    sys.stderr.flush()
+    binary = getattr(sys.stderr, "buffer", None)
+    if binary is not None:
+
+        def forward(chunk: bytes) -> None:
+            binary.write(chunk)
+            binary.flush()
 
-    captured = stderr_buffer.getvalue()
-    if captured:
-        sys.stderr.write(captured)
+        return forward
+
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def forward_text(chunk: bytes) -> None:
+        sys.stderr.write(decoder.decode(chunk))
         sys.stderr.flush()
 
-    payloads = _decode_json_stream(captured)
-    payload = payloads[-1] if payloads else None
-    return ManifestResult(exit_code=exit_code, payload=payload)
+    return forward_text
+
+
+def _dumps_indented(payload: dict) -> str:
+    """Serialise ``payload`` as two-space indented JSON, via orjson if present."""
+
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(payload, indent=2)
 
 
 def _build_json_output(
@@ -202,7 +327,7 @@ def _build_json_output(
     if parse_result is not None:
         payload["parse"] = {
             "scripts_scanned": parse_result.scripts_scanned,
-            "issues": parse_result.issues,
+            "issues": [issue.to_dict() for issue in parse_result.issues],
         }
     else:
         payload["parse"] = {"skipped": True}
@@ -218,7 +343,7 @@ def _build_json_output(
     else:
         payload["manifest"] = {"skipped": True}
 
-    return json.dumps(payload, indent=2)
+    return _dumps_indented(payload)
 
 
 def _build_human_output(
@@ -226,41 +351,44 @@ def _build_human_output(
     manifest_result: Optional[ManifestResult],
     telemetry: dict,
 ) -> str:
-    lines = [
-        "Codex preflight summary:",
-        f"  Scripts scanned: {telemetry.get('scripts_scanned', 0)}",
-        f"  Parse failures: {telemetry.get('parse_failures', 0)}",
-    ]
+    buffer = io.StringIO()
+    write = buffer.write
+    write("Codex preflight summary:\n")
+    write(f"  Scripts scanned: {telemetry.get('scripts_scanned', 0)}\n")
+    write(f"  Parse failures: {telemetry.get('parse_failures', 0)}\n")
 
     manifest_attempted = telemetry.get("manifest_attempted", False)
     if manifest_attempted:
-        lines.append(
-            f"  Manifest exit code: {telemetry.get('manifest_exit_code', 'n/a')}"
-        )
+        write(f"  Manifest exit code: {telemetry.get('manifest_exit_code', 'n/a')}\n")
         if manifest_result and manifest_result.payload:
-            lines.append(
-                f"  Manifest coverage: {manifest_result.scripts_passed}/{manifest_result.scripts_total} scripts passed"
+            write(
+                f"  Manifest coverage: {manifest_result.scripts_passed}/{manifest_result.scripts_total} scripts passed\n"
             )
     else:
-        lines.append("  Manifest runner: skipped")
+        write("  Manifest runner: skipped\n")
 
     if parse_result and parse_result.issues:
-        lines.append("")
-        lines.append("Parse issues detected:")
-        for index, issue in enumerate(parse_result.issues, 1):
-            lines.append(f"  [{index}] {issue['path']}")
-            if issue["line"] is not None:
-                lines.append(
-                    f"      line {issue['line']}, column {issue['column']}"
-                )
-            lines.append(f"      {issue['message']}")
-            for context_line in issue["context"]:
-                lines.append(f"      {context_line}")
+        write("\nParse issues detected:\n")
+        write("".join(
+            _format_human_issue(index, issue)
+            for index, issue in enumerate(parse_result.issues, 1)
+        ))
     elif parse_result is None:
-        lines.append("")
-        lines.append("Parse stage skipped by request.")
+        write("\nParse stage skipped by request.\n")
 
-    return "\n".join(lines)
+    # Every fragment ends with a newline; drop the final one to match the
+    # ``print`` call in :func:`main`.
+    return buffer.getvalue()[:-1]
+
+
+def _format_human_issue(index: int, issue: EnrichedIssue) -> str:
+    location = (
+        f"      line {issue.line}, column {issue.column}\n"
+        if issue.line is not None
+        else ""
+    )
+    context = "".join(f"      {context_line}\n" for context_line in issue.context)
+    return f"  [{index}] {issue.path}\n{location}      {issue.message}\n{context}"
 
 
 def main(argv: Sequence[str] | None = None) -> int:
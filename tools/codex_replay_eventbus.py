@@ -9,19 +9,28 @@ so manual operators can diagnose issues locally with the same tooling.
 
 from __future__ import annotations
 
+import io
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+try:  # pragma: no cover - optional accelerator, exercised at runtime
+    import msgspec
+except ImportError:  # pragma: no cover - stdlib fallback
+    msgspec = None
 
 from .codex_godot_process_manager import CodexGodotProcessManager
 
 DEFAULT_REPLAY_SCRIPT = "res://tests/eventbus_replay_runner.gd"
 
 
-@dataclass
-class ReplayEntry:
-    """Represents a single replay attempt emitted by the harness."""
+class ReplayEntry(NamedTuple):
+    """Represents a single replay attempt emitted by the harness.
+
+    A named tuple rather than a dataclass: transcripts can carry tens of
+    thousands of entries and the tuple is smaller and cheaper to build.
+    """
 
     index: int
     signal_name: str
@@ -49,6 +58,124 @@ class ReplayReport:
         return exit_code == 0
 
 
+if msgspec is not None:
+
+    class _EntryMessage(msgspec.Struct, tag="eventbus_replay_entry", tag_field="type"):
+        index: int = 0
+        signal_name: str = ""
+        status: str = ""
+        message: str = ""
+        timestamp: Optional[str] = None
+
+        def apply(self, report: ReplayReport, raw: bytes) -> bool:
+            report.entries.append(
+                ReplayEntry(self.index, self.signal_name, self.status, self.message, self.timestamp)
+            )
+            return False
+
+    class _SummaryMessage(msgspec.Struct, tag="eventbus_replay_summary", tag_field="type"):
+        def apply(self, report: ReplayReport, raw: bytes) -> bool:
+            report.summary = _loads_text(raw)
+            return True
+
+    class _LogExportMessage(msgspec.Struct, tag="eventbus_replay_log_export", tag_field="type"):
+        path: Optional[str] = None
+
+        def apply(self, report: ReplayReport, raw: bytes) -> bool:
+            report.log_export_path = str(self.path)
+            return False
+
+    class _LogMessage(msgspec.Struct, tag="eventbus_replay_log", tag_field="type"):
+        def apply(self, report: ReplayReport, raw: bytes) -> bool:
+            report.logs.append(_loads_text(raw))
+            return False
+
+    class _EchoMessage(msgspec.Struct, tag="eventbus_replay_echo", tag_field="type"):
+        text: str = ""
+
+        def apply(self, report: ReplayReport, raw: bytes) -> bool:
+            report.echoed_log = self.text
+            return False
+
+    class _ErrorMessage(msgspec.Struct, tag="eventbus_replay_error", tag_field="type"):
+        def apply(self, report: ReplayReport, raw: bytes) -> bool:
+            report.summary = _loads_text(raw)
+            return True
+
+    # Summary, log and error records are stored verbatim in the report, so
+    # their structs only carry the tag and the full object is decoded on demand.
+    # ``strict=False`` accepts the numeric strings and integral floats that the
+    # ``int()`` coercions of the dict path accept, so such entries stay typed.
+    _MESSAGE_DECODER = msgspec.json.Decoder(
+        Union[
+            _EntryMessage,
+            _SummaryMessage,
+            _LogExportMessage,
+            _LogMessage,
+            _EchoMessage,
+            _ErrorMessage,
+        ],
+        strict=False,
+    )
+else:
+    _MESSAGE_DECODER = None
+
+
+def _loads_text(raw: bytes) -> object:
+    """Decode ``raw`` as JSON text, replacing bytes that are not valid UTF-8."""
+
+    return json.loads(raw.decode("utf-8", "replace"))
+
+
+def _decode_message(raw: bytes) -> object:
+    """Decode ``raw`` into a typed message when possible, else a plain dict.
+
+    Lines whose ``type`` is unknown, whose fields do not match the typed
+    schema or that are not valid UTF-8 fall back to :func:`json.loads` on the
+    replacement-decoded text, which raises :class:`json.JSONDecodeError` for
+    lines that are not JSON at all.
+    """
+
+    if _MESSAGE_DECODER is not None:
+        try:
+            return _MESSAGE_DECODER.decode(raw)
+        except (msgspec.DecodeError, UnicodeDecodeError):
+            pass
+    return _loads_text(raw)
+
+
+def _apply_message(report: ReplayReport, message: dict) -> bool:
+    """Fold a dict message into ``report``; return ``True`` when the run ended."""
+
+    get = message.get
+    message_type = get("type")
+    if message_type == "eventbus_replay_entry":
+        report.entries.append(
+            ReplayEntry(
+                int(get("index", 0)),
+                str(get("signal_name", "")),
+                str(get("status", "")),
+                str(get("message", "")),
+                get("timestamp"),
+            )
+        )
+    elif message_type == "eventbus_replay_summary":
+        report.summary = message
+        return True
+    elif message_type == "eventbus_replay_log_export":
+        report.log_export_path = str(get("path"))
+    elif message_type == "eventbus_replay_log":
+        report.logs.append(message)
+    elif message_type == "eventbus_replay_echo":
+        report.echoed_log = str(get("text", ""))
+    elif message_type == "eventbus_replay_error":
+        report.summary = message
+        return True
+    else:
+        report.diagnostics.append(message)
+    return False
+
+
 def replay_eventbus_transcript(
     replay_path: Path | str,
     *,
@@ -101,77 +228,74 @@ def replay_eventbus_transcript(
 
     report = ReplayReport()
     with CodexGodotProcessManager(extra_args=command, **manager_config) as manager:
-        message_iterator = manager.iter_messages(timeout=0.1)
-        while True:
-            try:
-                message = next(message_iterator)
-            except StopIteration:
+        finished = False
+        while not finished:
+            batch = manager.drain_messages(timeout=0.1)
+            if batch is None:
                 break
 
-            message_type = message.get("type")
-            if message_type == "eventbus_replay_entry":
-                report.entries.append(
-                    ReplayEntry(
-                        index=int(message.get("index", 0)),
-                        signal_name=str(message.get("signal_name", "")),
-                        status=str(message.get("status", "")),
-                        message=str(message.get("message", "")),
-                        timestamp=message.get("timestamp"),
-                    )
-                )
-            elif message_type == "eventbus_replay_summary":
-                report.summary = message
-                break
-            elif message_type == "eventbus_replay_log_export":
-                report.log_export_path = str(message.get("path"))
-            elif message_type == "eventbus_replay_log":
-                report.logs.append(message)
-            elif message_type == "eventbus_replay_echo":
-                report.echoed_log = str(message.get("text", ""))
-            elif message_type == "eventbus_replay_error":
-                report.summary = message
-                break
-            else:
-                report.diagnostics.append(message)
+            for raw in batch:
+                try:
+                    message = _decode_message(raw)
+                except json.JSONDecodeError:
+                    manager.report_protocol_error(raw)
+                    continue
+
+                if isinstance(message, dict):
+                    finished = _apply_message(report, message)
+                else:
+                    finished = message.apply(report, raw)
+                if finished:
+                    break
 
         report.diagnostics.extend(list(manager.iter_stderr_diagnostics()))
 
     return report
 
 
+_REPORT_HEADER = "EventBus Replay Summary\n=======================\n"
+
+# ``json.dumps`` with non-default options builds a fresh encoder per call; the
+# report renders every log and diagnostic through this shared one instead.
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True)
+
+
 def format_report(report: ReplayReport) -> str:
     """Render a human readable summary for terminal output."""
 
-    lines = []
-    lines.append("EventBus Replay Summary")
-    lines.append("=======================")
-    lines.append(
+    buffer = io.StringIO()
+    write = buffer.write
+    write(_REPORT_HEADER)
+    summary = report.summary
+    write(
         f"Status: {'OK' if report.success else 'FAILED'} | "
-        f"Entries: {report.summary.get('total', len(report.entries))} | "
-        f"Succeeded: {report.summary.get('succeeded', 0)} | "
-        f"Failed: {report.summary.get('failed', 0)} | "
-        f"Skipped: {report.summary.get('skipped', 0)}"
+        f"Entries: {summary.get('total', len(report.entries))} | "
+        f"Succeeded: {summary.get('succeeded', 0)} | "
+        f"Failed: {summary.get('failed', 0)} | "
+        f"Skipped: {summary.get('skipped', 0)}\n"
     )
     if report.log_export_path:
-        lines.append(f"Log exported to: {report.log_export_path}")
+        write(f"Log exported to: {report.log_export_path}\n")
     if report.echoed_log:
-        lines.append("\nHarness Log:")
-        lines.append(report.echoed_log)
+        write(f"\nHarness Log:\n{report.echoed_log}\n")
     if report.entries:
-        lines.append("\nEntries:")
+        write("\nEntries:\n")
         for entry in report.entries:
-            lines.append(
-                f"  [{entry.index:02d}] {entry.signal_name or 'n/a'} -> {entry.status.upper()} | {entry.message}"
+            write(
+                f"  [{entry.index:02d}] {entry.signal_name or 'n/a'} -> {entry.status.upper()} | {entry.message}\n"
             )
     if report.logs:
-        lines.append("\nHarness Messages:")
+        write("\nHarness Messages:\n")
         for log in report.logs:
-            lines.append(json.dumps(log, sort_keys=True))
+            write(_CANONICAL_ENCODER.encode(log))
+            write("\n")
     if report.diagnostics:
-        lines.append("\nDiagnostics:")
+        write("\nDiagnostics:\n")
         for diagnostic in report.diagnostics:
-            lines.append(json.dumps(diagnostic, sort_keys=True))
-    return "\n".join(lines)
+            write(_CANONICAL_ENCODER.encode(diagnostic))
+            write("\n")
+    # Every line ends with a newline; drop the final one to match the joined form.
+    return buffer.getvalue()[:-1]
 
 
 __all__ = [
@@ -27,16 +27,31 @@ required once those are exported.
 from __future__ import annotations
 
 import argparse
+import collections
+import contextlib
+import copy
+import functools
 import json
+import mmap
 import os
+import queue
+import subprocess
 import sys
 import textwrap
 import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence
-from xml.etree import ElementTree
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence
+try:  # pragma: no cover - optional accelerator, exercised at runtime
+    from lxml import etree as ElementTree
+except ImportError:  # pragma: no cover - stdlib fallback
+    from xml.etree import ElementTree
+
+try:  # pragma: no cover - optional accelerator, exercised at runtime
+    import orjson
+except ImportError:  # pragma: no cover - stdlib fallback
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Ensure the repository root is importable when the module is executed as a
@@ -90,6 +105,30 @@ class ManifestSummary:
         return self.scripts_passed + self.scripts_failed
 
 
+_DETAIL_WRAPPER = textwrap.TextWrapper(subsequent_indent="      ")
+
+
+def _wrap_detail(text: str) -> str:
+    """Wrap an error or JUnit message for :meth:`ManifestRun.human_summary`."""
+
+    # Short single-line text without tabs, newlines or trailing spaces is
+    # returned unchanged by ``fill``, so the wrapper is only engaged otherwise.
+    if len(text) <= _DETAIL_WRAPPER.width and text.isprintable() and not text.endswith(" "):
+        return text
+    return _DETAIL_WRAPPER.fill(text)
+
+
+@functools.lru_cache(maxsize=64)
+def _format_clock(seconds: int) -> str:
+    """Render a log timestamp for :meth:`ManifestRun.human_summary`.
+
+    Diagnostics tend to arrive in bursts, so the tail usually repeats the same
+    second and the formatted value is reused.
+    """
+
+    return time.strftime("%H:%M:%S", time.localtime(seconds))
+
+
 @dataclass
 class ManifestRun:
     """Structured payload shared with Codex and printed for humans."""
@@ -164,24 +203,16 @@ class ManifestRun:
                 lines.append(f"  - {detail}")
                 if script.errors:
                     for entry in script.errors:
-                        wrapped = textwrap.fill(entry, subsequent_indent="      ")
-                        lines.append(f"      error: {wrapped}")
+                        lines.append(f"      error: {_wrap_detail(entry)}")
                 if script.xml_failure and script.xml_failure not in script.errors:
-                    wrapped = textwrap.fill(
-                        script.xml_failure,
-                        subsequent_indent="      ",
-                    )
-                    lines.append(f"      junit: {wrapped}")
+                    lines.append(f"      junit: {_wrap_detail(script.xml_failure)}")
 
         if self.logs:
             lines.append("")
             lines.append("Recent diagnostics:")
             excerpt = self.logs[-5:]
             for log in excerpt:
-                timestamp = time.strftime(
-                    "%H:%M:%S",
-                    time.localtime(float(log.get("timestamp", time.time()))),
-                )
+                timestamp = _format_clock(int(float(log.get("timestamp", time.time()))))
                 source = log.get("stream", "stderr")
                 text = log.get("text", "")
                 lines.append(f"  [{timestamp}] {source}: {text}")
@@ -194,17 +225,33 @@ class ManifestRun:
 
 
 def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = _build_parser(
+        os.environ.get("CODEX_PROJECT_ROOT"),
+        os.environ.get("CODEX_GODOT_BIN"),
+        os.environ.get("CODEX_GODOT_TIMEOUT", "1800"),
+    )
+    return parser.parse_args(argv)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_parser(
+    default_project_root: Optional[str],
+    default_godot_binary: Optional[str],
+    default_run_timeout: str,
+) -> argparse.ArgumentParser:
+    # Keyed on the environment-derived defaults so a changed environment
+    # still yields a matching parser.
     parser = argparse.ArgumentParser(
         description="Run the Godot manifest tests using the Codex orchestration helpers.",
     )
     parser.add_argument(
         "--project-root",
-        default=os.environ.get("CODEX_PROJECT_ROOT"),
+        default=default_project_root,
         help="Filesystem path to the Godot project (defaults to CODEX_PROJECT_ROOT).",
     )
     parser.add_argument(
         "--godot-binary",
-        default=os.environ.get("CODEX_GODOT_BIN"),
+        default=default_godot_binary,
         help="Path to the Godot executable (defaults to CODEX_GODOT_BIN).",
     )
     parser.add_argument(
@@ -234,6 +281,15 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=0.0,
         help="Seconds to wait between retries when --max-retries > 1.",
     )
+    parser.add_argument(
+        "--run-timeout",
+        type=float,
+        default=default_run_timeout,
+        help=(
+            "Seconds a single Godot run may take before it is killed (defaults to "
+            "CODEX_GODOT_TIMEOUT or 1800; 0 disables the limit)."
+        ),
+    )
     parser.add_argument(
         "--output",
         metavar="DIR",
@@ -249,19 +305,16 @@ def _parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         choices=["generator_core", "diagnostics", "platform_gui"],
         help="Restrict execution to a single manifest group.",
     )
-    return parser.parse_args(argv)
+    return parser
 
 
 def _cleanup_reports(paths: Iterable[Path]) -> None:
     for path in paths:
-        try:
-            path.unlink()
-        except FileNotFoundError:
-            continue
+        path.unlink(missing_ok=True)
 
 
-def _collect_diagnostics(manager: CodexGodotProcessManager, sink: List[Dict[str, str]]) -> None:
-    for payload in manager.iter_stderr_diagnostics():
+def _collect_diagnostics(manager: CodexGodotProcessManager, sink: Deque[Dict[str, str]]) -> None:
+    for payload in manager.drain_stderr_diagnostics():
         if isinstance(payload, dict):
             sink.append({
                 "timestamp": str(payload.get("timestamp", time.time())),
@@ -271,6 +324,28 @@ def _collect_diagnostics(manager: CodexGodotProcessManager, sink: List[Dict[str,
             })
 
 
+#: Prefix of the single-line JSON record printed to stderr once the final
+#: attempt completes.  It carries the ``summary`` and ``scripts`` sections of
+#: the payload so callers such as ``codex_preflight`` can read the outcome
+#: without scanning the full log.
+MANIFEST_SUMMARY_MARKER = "__CODEX_MANIFEST_SUMMARY__"
+
+#: Number of stderr diagnostics retained per Godot run, i.e. per group of an
+#: attempt.  Older lines are dropped; the human summary only ever shows the
+#: last few.
+LOG_TAIL = 512
+
+#: Exit code reported for a Godot run that was killed after ``--run-timeout``.
+#: Matches coreutils ``timeout`` and, being positive, survives the ``max()``
+#: aggregation across groups.
+RUN_TIMEOUT_EXIT_CODE = 124
+
+#: Seconds between diagnostic drains (and timeout checks) while waiting for
+#: Godot to exit.  The process manager's I/O thread keeps reading the pipes in
+#: the meantime, so this only bounds how long buffered records sit unread.
+EXIT_WAIT_INTERVAL = 0.25
+
+
 MANIFEST_GROUP_SCRIPTS: Dict[str, str] = {
     "generator_core": "res://tests/run_generator_tests.gd",
     "diagnostics": "res://tests/run_diagnostics_tests.gd",
@@ -284,8 +359,14 @@ def _run_godot(
     godot_binary: Path,
     script_path: str,
     extra_env: Optional[Dict[str, str]] = None,
+    timeout: Optional[float] = None,
 ) -> tuple[int, List[Dict[str, str]], float]:
-    """Launch Godot using the process manager and wait for completion."""
+    """Launch Godot using the process manager and wait for completion.
+
+    When ``timeout`` is a positive number of seconds the process is killed once
+    it elapses, :data:`RUN_TIMEOUT_EXIT_CODE` is returned and a synthetic log
+    entry records the reason.
+    """
 
     manager = CodexGodotProcessManager(
         godot_binary=str(godot_binary),
@@ -294,35 +375,71 @@ def _run_godot(
         env_overrides=extra_env,
     )
 
-    logs: List[Dict[str, str]] = []
+    logs: Deque[Dict[str, str]] = collections.deque(maxlen=LOG_TAIL)
     start_time = time.perf_counter()
 
     with manager:
-        stderr_thread = threading.Thread(
-            target=_collect_diagnostics,
-            args=(manager, logs),
-            name="CodexGodotDiagnosticsCollector",
-            daemon=True,
-        )
-        stderr_thread.start()
-
         assert manager._process is not None  # Access internal state for wait semantics.
-        exit_code = manager._process.wait()
+        deadline = time.monotonic() + timeout if timeout and timeout > 0 else None
+        while True:
+            try:
+                # Blocks on the process exit itself (pidfd/kqueue) rather than
+                # ``Popen.wait``'s sleep loop; each wake-up drains diagnostics.
+                exit_code = manager.wait_for_exit(EXIT_WAIT_INTERVAL)
+                break
+            except subprocess.TimeoutExpired:
+                _collect_diagnostics(manager, logs)
+                if deadline is not None and time.monotonic() >= deadline:
+                    manager._process.kill()
+                    manager._process.wait()
+                    exit_code = RUN_TIMEOUT_EXIT_CODE
+                    logs.append({
+                        "timestamp": str(time.time()),
+                        "stream": "timeout",
+                        "text": f"Godot did not exit within {timeout:g}s and was killed.",
+                        "level": "error",
+                    })
+                    break
         manager.stop()
-        stderr_thread.join(timeout=1.0)
+        # ``stop`` lets the I/O thread read both pipes to EOF before joining it,
+        # so this picks up everything Godot wrote before exiting.
+        _collect_diagnostics(manager, logs)
 
     duration = time.perf_counter() - start_time
-    return exit_code, logs, duration
+    return exit_code, list(logs), duration
 
 
-def _load_json_results(path: Path) -> tuple[ManifestSummary, List[ScriptReport], Dict[str, Any]]:
+#: Reports at least this large are memory-mapped and handed to orjson
+#: directly instead of being copied into a ``bytes`` object first.
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_json_file(path: Path) -> Any:
+    if orjson is None:
+        return json.loads(path.read_bytes())
+
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size < _MMAP_THRESHOLD:
+            return orjson.loads(handle.read())
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            with memoryview(mapped) as view:
+                return orjson.loads(view)
+
+
+def _load_json_results(
+    path: Path, group: Optional[str] = None
+) -> tuple[ManifestSummary, List[ScriptReport], Dict[str, Any]]:
     if not path.exists():
         return ManifestSummary(error=f"JSON results missing at {path}"), [], {}
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = _read_json_file(path)
     payload: Dict[str, Any] = data if isinstance(data, dict) else {}
-    summary_data = payload.get("summary", {}) if isinstance(payload.get("summary"), dict) else {}
-    tests_data = payload.get("tests", []) if isinstance(payload.get("tests"), list) else []
+    summary_data = payload.get("summary")
+    if not isinstance(summary_data, dict):
+        summary_data = {}
+    tests_data = payload.get("tests")
+    if not isinstance(tests_data, list):
+        tests_data = []
 
     summary = ManifestSummary(
         scripts_passed=int(summary_data.get("scripts_passed", 0) or 0),
@@ -344,28 +461,19 @@ def _load_json_results(path: Path) -> tuple[ManifestSummary, List[ScriptReport],
                     successes=int(entry.get("successes", 0) or 0),
                     failures=int(entry.get("failures", 0) or 0),
                     errors=[str(err) for err in entry.get("errors", []) if isinstance(err, str)],
+                    group=group,
                 )
             )
 
     return summary, scripts, payload
 
 
-def _augment_with_xml(path: Path, scripts: List[ScriptReport]) -> None:
-    if not path.exists():
-        return
-
-    try:
-        xml_root = ElementTree.fromstring(path.read_text(encoding="utf-8"))
-    except ElementTree.ParseError:
-        return
-
+def _augment_with_xml(root: ElementTree.Element, scripts: List[ScriptReport]) -> None:
     failures: Dict[str, str] = {}
-    for testcase in xml_root.findall(".//testcase"):
+    for testcase in root.iter("testcase"):
         name = testcase.get("name")
-        if not name:
-            continue
         failure_node = testcase.find("failure")
-        if failure_node is not None:
+        if name and failure_node is not None:
             text = failure_node.get("message") or failure_node.text or ""
             failures[name] = text.strip()
 
@@ -384,8 +492,10 @@ def _load_xml_root(path: Path) -> Optional[ElementTree.Element]:
     if not path.exists():
         return None
 
+    # Parse from the file rather than decoded text: lxml refuses ``str`` input
+    # that carries an XML encoding declaration.
     try:
-        return ElementTree.fromstring(path.read_text(encoding="utf-8"))
+        return ElementTree.parse(str(path)).getroot()
     except ElementTree.ParseError:
         return None
 
@@ -396,7 +506,8 @@ def _merge_junit_roots(roots: Sequence[ElementTree.Element]) -> Optional[Element
         if root.tag == "testsuite":
             suites.append(root)
         elif root.tag == "testsuites":
-            suites.extend(list(root))
+            # lxml also yields comments and processing instructions as children.
+            suites.extend(child for child in root if isinstance(child.tag, str))
 
     if not suites:
         return None
@@ -407,7 +518,10 @@ def _merge_junit_roots(roots: Sequence[ElementTree.Element]) -> Optional[Element
     total_time = 0.0
 
     for suite in suites:
-        clone = ElementTree.fromstring(ElementTree.tostring(suite, encoding="utf-8"))
+        clone = copy.deepcopy(suite)
+        # The copy keeps the whitespace that followed the suite in its source
+        # document; drop it so suites are emitted back to back.
+        clone.tail = None
         merged.append(clone)
 
         for key in totals:
@@ -428,12 +542,48 @@ def _merge_junit_roots(roots: Sequence[ElementTree.Element]) -> Optional[Element
     return merged
 
 
-def _persist_outputs(output_dir: Path, run: ManifestRun) -> None:
+def _encode_indented(payload: Dict[str, Any], *, trailing_newline: bool = False) -> bytes:
+    """Serialise ``payload`` as two-space indented UTF-8 JSON, via orjson if present.
+
+    ``trailing_newline`` appends the final newline during encoding
+    (``OPT_APPEND_NEWLINE``) so file writers never concatenate a second copy.
+    """
+
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2
+        if trailing_newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        return orjson.dumps(payload, option=option)
+    text = json.dumps(payload, indent=2)
+    return (text + "\n" if trailing_newline else text).encode("utf-8")
+
+
+def _encode_compact(payload: Any) -> str:
+    """Serialise ``payload`` as single-line JSON, via orjson if present."""
+
+    if orjson is not None:
+        return orjson.dumps(payload).decode("utf-8")
+    return json.dumps(payload, separators=(",", ":"))
+
+
+def _persist_outputs(output_dir: Path, summary_text: str, encoded_payload: bytes) -> None:
+    """Snapshot the rendered summary and the already encoded JSON payload."""
+
     output_dir.mkdir(parents=True, exist_ok=True)
-    summary_path = output_dir / "summary.txt"
-    summary_path.write_text(run.human_summary() + "\n", encoding="utf-8")
-    payload_path = output_dir / "codex_payload.json"
-    payload_path.write_text(json.dumps(run.as_json(), indent=2) + "\n", encoding="utf-8")
+    _write_atomic(output_dir / "summary.txt", (summary_text + "\n").encode("utf-8"))
+    _write_atomic(output_dir / "codex_payload.json", encoded_payload)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never observe a partial file."""
+
+    temp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
 
 
 def _execute_attempt(
@@ -447,11 +597,14 @@ def _execute_attempt(
     xml_path: Path,
     cleanup: bool,
     group: Optional[str],
+    run_timeout: Optional[float] = None,
 ) -> ManifestRun:
     groups_to_run = [group] if group else list(MANIFEST_GROUP_SCRIPTS.keys())
 
     aggregated_summary = ManifestSummary()
     aggregated_scripts: List[ScriptReport] = []
+    # Each group's logs are already capped at LOG_TAIL by ``_run_godot``; they
+    # are concatenated so a chatty group cannot evict another group's tail.
     aggregated_logs: List[Dict[str, str]] = []
     aggregated_duration = 0.0
     aggregated_exit_code = 0
@@ -479,6 +632,7 @@ def _execute_attempt(
                 "CODEX_TEST_MANIFEST": str(manifest_path),
                 "CODEX_MANIFEST_GROUP": group_name,
             },
+            timeout=run_timeout,
         )
 
         aggregated_exit_code = max(aggregated_exit_code, exit_code)
@@ -489,14 +643,14 @@ def _execute_attempt(
             entry.setdefault("group", group_name)
             aggregated_logs.append(entry)
 
-        summary, scripts, raw_payload = _load_json_results(json_path)
-        for script in scripts:
-            script.group = group_name
-        _augment_with_xml(xml_path, scripts)
-
+        summary, scripts, raw_payload = _load_json_results(json_path, group_name)
+        # The report is parsed once; the same tree annotates failing scripts
+        # and is later merged into the aggregated results.xml.
         xml_root = _load_xml_root(xml_path)
         if xml_root is not None:
             xml_roots.append(xml_root)
+            if any(not script.passed for script in scripts):
+                _augment_with_xml(xml_root, scripts)
 
         aggregated_summary.scripts_passed += summary.scripts_passed
         aggregated_summary.scripts_failed += summary.scripts_failed
@@ -544,7 +698,7 @@ def _execute_attempt(
 
     results_json_path: Optional[str] = None
     if groups_to_run:
-        json_path.write_text(json.dumps(raw_json_payload, indent=2) + "\n", encoding="utf-8")
+        json_path.write_bytes(_encode_indented(raw_json_payload, trailing_newline=True))
         results_json_path = str(json_path)
 
     results_xml_path: Optional[str] = None
@@ -571,6 +725,78 @@ def _execute_attempt(
     return run
 
 
+def _resolve_path(base: Path, value: str) -> Path:
+    """Resolve ``value`` relative to ``base`` unless it is already absolute."""
+
+    # ``os.path.join`` discards ``base`` for absolute values, so a single
+    # ``realpath`` covers both cases.
+    return Path(os.path.realpath(os.path.join(base, value)))
+
+
+class _StderrWriter:
+    """Write encoded payloads to stderr from a background thread.
+
+    A slow stderr consumer would otherwise block the retry loop on every
+    payload; queued chunks are coalesced into a single write and flush.  A
+    failed write (typically ``BrokenPipeError`` once the reader has gone)
+    stops the thread and is re-raised by the next :meth:`write` or by
+    :meth:`close`, as a direct write would have raised in the caller.
+    """
+
+    def __init__(self) -> None:
+        self._queue: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="CodexManifestStderr", daemon=True)
+        self._thread.start()
+
+    def write(self, data: bytes) -> None:
+        self._raise_error()
+        self._queue.put(data)
+
+    def close(self) -> None:
+        """Flush everything queued so far and stop the writer thread."""
+
+        self._queue.put(None)
+        self._thread.join()
+        self._raise_error()
+
+    def _raise_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def _run(self) -> None:
+        try:
+            self._drain()
+        except Exception as error:
+            self._error = error
+
+    def _drain(self) -> None:
+        stream = sys.stderr
+        buffer = getattr(stream, "buffer", None)
+        finished = False
+        while not finished:
+            chunks = [self._queue.get()]
+            while True:
+                try:
+                    chunks.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in chunks:
+                finished = True
+                chunks = chunks[: chunks.index(None)]
+            if not chunks:
+                continue
+            data = b"".join(chunks)
+            if buffer is not None:
+                stream.flush()
+                buffer.write(data)
+                buffer.flush()
+            else:
+                stream.write(data.decode("utf-8"))
+                stream.flush()
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     args = _parse_args(argv)
 
@@ -581,38 +807,63 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     project_root = Path(args.project_root).resolve()
     godot_binary = Path(args.godot_binary).resolve()
-    manifest_path = (project_root / args.manifest).resolve() if not os.path.isabs(args.manifest) else Path(args.manifest).resolve()
-    json_path = (project_root / args.results_json).resolve() if not os.path.isabs(args.results_json) else Path(args.results_json).resolve()
-    xml_path = (project_root / args.results_xml).resolve() if not os.path.isabs(args.results_xml) else Path(args.results_xml).resolve()
+    manifest_path = _resolve_path(project_root, args.manifest)
+    json_path = _resolve_path(project_root, args.results_json)
+    xml_path = _resolve_path(project_root, args.results_xml)
 
     attempts = max(1, int(args.max_retries))
     retry_delay = max(0.0, float(args.retry_delay))
 
     last_run: Optional[ManifestRun] = None
-    for attempt in range(1, attempts + 1):
-        run = _execute_attempt(
-            attempt=attempt,
-            max_attempts=attempts,
-            project_root=project_root,
-            godot_binary=godot_binary,
-            manifest_path=manifest_path,
-            json_path=json_path,
-            xml_path=xml_path,
-            cleanup=not args.keep_artifacts,
-            group=args.group,
-        )
-        last_run = run
-
-        print(run.human_summary())
-        print(json.dumps(run.as_json(), indent=2), file=sys.stderr)
-
-        if run.exit_code == 0:
-            break
-        if attempt < attempts:
-            time.sleep(retry_delay)
+    last_payload: Dict[str, object] = {}
+    last_summary = ""
+    last_encoded = b""
+    stderr_writer = _StderrWriter()
+    try:
+        for attempt in range(1, attempts + 1):
+            run = _execute_attempt(
+                attempt=attempt,
+                max_attempts=attempts,
+                project_root=project_root,
+                godot_binary=godot_binary,
+                manifest_path=manifest_path,
+                json_path=json_path,
+                xml_path=xml_path,
+                cleanup=not args.keep_artifacts,
+                group=args.group,
+                run_timeout=args.run_timeout,
+            )
+            last_run = run
+            # Built, rendered and encoded once per attempt; the marker and the
+            # --output snapshots reuse them instead of serialising again.
+            last_payload = run.as_json()
+            last_summary = run.human_summary()
+            last_encoded = _encode_indented(last_payload, trailing_newline=True)
+
+            print(last_summary)
+            stderr_writer.write(last_encoded)
+
+            if run.exit_code == 0:
+                break
+            if attempt < attempts:
+                time.sleep(retry_delay)
+
+        if last_run is not None:
+            marker_payload = {
+                "summary": last_payload["summary"],
+                "scripts": last_payload["scripts"],
+            }
+            marker = f"{MANIFEST_SUMMARY_MARKER} {_encode_compact(marker_payload)}\n"
+            stderr_writer.write(marker.encode("utf-8"))
+    except BaseException:
+        # The error already in flight wins over a secondary writer failure.
+        with contextlib.suppress(Exception):
+            stderr_writer.close()
+        raise
+    stderr_writer.close()
 
     if args.output and last_run is not None:
-        _persist_outputs(Path(args.output), last_run)
+        _persist_outputs(Path(args.output), last_summary, last_encoded)
 
     return 0 if last_run is None else last_run.exit_code
 
@@ -2,6 +2,7 @@
 """Normalise the WordlistPanel scene for headless test execution."""
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 TSCN_PATH = Path("addons/platform_gui/panels/wordlist/WordlistPanel.tscn")
@@ -15,6 +16,15 @@ REPLACEMENTS = {
     "TextServer.AUTOWRAP_WORD_SMART": "3",
 }
 
+# Longest tokens first so ``SIZE_EXPAND_FILL`` wins over its prefix ``SIZE_EXPAND``.
+_REPLACEMENT_PATTERN = re.compile(
+    "|".join(re.escape(token) for token in sorted(REPLACEMENTS, key=len, reverse=True))
+)
+
+# Line boundaries other than ``\n`` that ``str.splitlines`` also splits on; their
+# presence means the rewritten file will differ from the original.
+_FOREIGN_LINE_BREAK = re.compile("[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
 UNIQUE_NODES = {
     "RefreshButton",
     "ResourceList",
@@ -31,41 +41,47 @@ UNIQUE_NODES = {
 
 def ensure_unique_name(lines: list[str]) -> list[str]:
     result: list[str] = []
-    total = len(lines)
-    index = 0
-    while index < total:
-        line = lines[index]
+    # Lines following a unique node header, held back until we know whether
+    # the section already sets the flag (``None`` when no header is pending).
+    held: list[str] | None = None
+    for line in lines:
+        if held is not None:
+            if line.startswith("[") or ("unique_name_in_owner" not in line and line.strip() == ""):
+                # Section ended without the flag; insert it right after the header.
+                result.append("unique_name_in_owner = true")
+                result.extend(held)
+                held = None
+            elif "unique_name_in_owner" in line:
+                result.extend(held)
+                held = None
+            else:
+                held.append(line)
+                continue
         result.append(line)
         if line.startswith("[node ") and "name=\"" in line:
             name = line.split("name=\"")[1].split("\"")[0]
             if name in UNIQUE_NODES:
-                has_flag = False
-                lookahead = index + 1
-                while lookahead < total:
-                    next_line = lines[lookahead]
-                    if next_line.startswith("["):
-                        break
-                    if "unique_name_in_owner" in next_line:
-                        has_flag = True
-                        break
-                    if next_line.strip() == "":
-                        # stop before blank separator
-                        break
-                    lookahead += 1
-                if not has_flag:
-                    result.append("unique_name_in_owner = true")
-        index += 1
+                held = []
+    if held is not None:
+        result.append("unique_name_in_owner = true")
+        result.extend(held)
     return result
 
 
 def main() -> None:
-    text = TSCN_PATH.read_text(encoding="utf-8")
-    for token, value in REPLACEMENTS.items():
-        text = text.replace(token, value)
+    source = TSCN_PATH.read_text(encoding="utf-8")
+    text = source
+    if _REPLACEMENT_PATTERN.search(text):
+        text = _REPLACEMENT_PATTERN.sub(lambda match: REPLACEMENTS[match.group(0)], text)
     lines = text.splitlines()
     updated_lines = ensure_unique_name(lines)
+    # Nothing replaced, no flag inserted and only ``\n`` line breaks: the
+    # rebuilt text would match the file, so skip joining and comparing it.
+    if text is source and len(updated_lines) == len(lines) and not _FOREIGN_LINE_BREAK.search(source):
+        print("No changes necessary.")
+        return
     new_text = "\n".join(updated_lines) + "\n"
-    if new_text == text + ("\n" if not text.endswith("\n") else ""):
+    if new_text == source + ("\n" if not source.endswith("\n") else ""):
         print("No changes necessary.")
         return
     TSCN_PATH.write_text(new_text, encoding="utf-8")
@@ -0,0 +1,54 @@
+"""Regression tests for ``codex_run_manifest_tests`` against a fake Godot binary.
+
+Run with ``python -m unittest tools.test_codex_run_manifest_tests`` from the
+repository root.  No Godot installation is required.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+if __package__ in (None, ""):  # pragma: no cover - direct execution guard
+    sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from tools.codex_run_manifest_tests import _run_godot
+
+
+_FAKE_GODOT = textwrap.dedent(
+    """\
+    #!{python}
+    import sys
+
+    # One write, so the sentinel is still queued in the pipe when Godot exits.
+    burst = "".join(f"{{index}}\\n" for index in range({lines}))
+    sys.stderr.write(burst + "FINAL\\n")
+    sys.stderr.flush()
+    """
+)
+
+
+class RunGodotTailTests(unittest.TestCase):
+    def test_stderr_tail_survives_large_burst(self) -> None:
+        with tempfile.TemporaryDirectory() as workdir:
+            godot = Path(workdir, "godot")
+            godot.write_text(_FAKE_GODOT.format(python=sys.executable, lines=200_000))
+            os.chmod(godot, 0o755)
+
+            exit_code, logs, _ = _run_godot(
+                project_root=Path(workdir),
+                godot_binary=godot,
+                script_path="res://tests/run_generator_tests.gd",
+            )
+
+        self.assertEqual(exit_code, 0)
+        self.assertTrue(logs)
+        self.assertEqual(logs[-1]["text"], "FINAL")
+
+
+if __name__ == "__main__":  # pragma: no cover - manual execution guard
+    unittest.main()